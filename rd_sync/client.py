@@ -1,24 +1,46 @@
 import asyncio
 import logging
 import math
+import random
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 
 from rd_sync.config import Settings
-from rd_sync.models.torrents import TorrentInfo, TorrentList
+from rd_sync.models.torrents import Torrent, TorrentInfo, TorrentList
+from rd_sync.transport import AiohttpTransport
 from rd_sync.utils import RateLimiter
 
+# Retries for requests rejected with "Slow down" or "Too many requests"
+MAX_THROTTLE_RETRIES = 3
+THROTTLE_ERROR_CODES = (5, 34)
+
+# Torrent info younger than this is served from cache without a request
+INFO_CACHE_TTL = 2.0
+INFO_CACHE_SIZE = 1024
+
 
 # Custom exceptions
 class RealDebridAPIError(Exception):
     """Exception raised for Real-Debrid API errors with error codes."""
 
-    def __init__(self, message: str, error_code: Optional[int] = None):
-        self.error_code = error_code
-        # Map common error codes to human readable messages
-        self.error_map = {
+    # Map common error codes to human readable messages
+    error_map: ClassVar[Mapping[int, str]] = MappingProxyType(
+        {
             35: "Infringing file",
             1: "Missing parameter",
             2: "Bad parameter value",
@@ -56,9 +78,16 @@ class RealDebridAPIError(Exception):
             34: "Too many requests",
             36: "Fair Usage Limit",
         }
+    )
+    # Message suffixes, prebuilt so raising only needs a lookup
+    _ERROR_SUFFIXES: ClassVar[Mapping[int, str]] = MappingProxyType(
+        {code: f" ({name})" for code, name in error_map.items()}
+    )
 
-        if error_code and error_code in self.error_map:
-            message = f"{message} ({self.error_map[error_code]})"
+    def __init__(self, message: str, error_code: Optional[int] = None):
+        self.error_code = error_code
+        if error_code:
+            message += self._ERROR_SUFFIXES.get(error_code, "")
         super().__init__(message)
 
 
@@ -72,15 +101,107 @@ class TorrentError(RealDebridError):
     pass
 
 
+def _is_throttled(response: httpx.Response) -> bool:
+    """Check if the API rejected a request for exceeding its rate limit."""
+    if response.status_code == 429:
+        return True
+    if response.status_code < 400:
+        return False
+    try:
+        return response.json().get("error_code") in THROTTLE_ERROR_CODES
+    except (ValueError, AttributeError):
+        return False
+
+
+def _retry_after(response: httpx.Response, attempt: int) -> float:
+    """Get how long to wait before retrying a throttled request."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return float(2**attempt)
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the HTTP client used to talk to the Real-Debrid API.
+
+    Args:
+        settings: Settings providing base URL, timeouts and pool limits
+
+    Returns:
+        httpx client backed by the configured HTTP backend
+    """
+    transport: httpx.AsyncBaseTransport
+    if settings.api_http_backend == "aiohttp":
+        transport = AiohttpTransport(
+            max_connections=settings.api_max_connections,
+            keepalive_expiry=settings.api_keepalive_expiry_secs,
+        )
+    else:
+        # Pool limits and HTTP/2 are configured on the transport, since
+        # httpx ignores them on the client when a transport is supplied
+        transport = httpx.AsyncHTTPTransport(
+            http2=settings.api_http2,
+            limits=httpx.Limits(
+                max_connections=settings.api_max_connections,
+                max_keepalive_connections=settings.api_max_keepalive_connections,
+                keepalive_expiry=settings.api_keepalive_expiry_secs,
+            ),
+            retries=settings.api_retries,
+        )
+
+    return httpx.AsyncClient(
+        base_url=settings.api_base_url,
+        timeout=settings.api_timeout_secs,
+        transport=transport,
+    )
+
+
+# HTTP client shared by all RealDebridClient instances
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client(settings: Settings) -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use.
+
+    Every account talks to the same API host, so sharing one client lets
+    all of them reuse the same pool of keep-alive connections.
+
+    Args:
+        settings: Settings used if the client has to be created
+
+    Returns:
+        Shared httpx client
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_http_client(settings)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client and its connections."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 class RealDebridClient:
     """Real-Debrid API client."""
 
-    def __init__(self, api_key: str, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        api_key: str,
+        settings: Optional[Settings] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the Real-Debrid client.
 
         Args:
             api_key: Real-Debrid API key
             settings: Optional settings object
+            http_client: Optional HTTP client owned by the caller, defaults
+                to the process-wide shared client
         """
         self.api_key = api_key
         self.settings = settings or Settings()
@@ -89,9 +210,7 @@ class RealDebridClient:
         if self.settings.disable_httpx_logging:
             logging.getLogger("httpx").setLevel(logging.WARNING)
 
-        self.client = httpx.AsyncClient(
-            base_url=self.settings.api_base_url, timeout=self.settings.api_timeout_secs
-        )
+        self.client = http_client or get_shared_client(self.settings)
         # Initialize rate limiters
         self.api_limiter = RateLimiter(
             calls=self.settings.api_rate_limit_per_minute, period=60.0
@@ -99,6 +218,39 @@ class RealDebridClient:
         self.torrents_limiter = RateLimiter(
             calls=self.settings.torrents_rate_limit_per_minute, period=60.0
         )
+        # Torrent info by ID as (etag, fetched_at, info), least recent first
+        self._info_cache: OrderedDict[str, Tuple[Optional[str], float, TorrentInfo]] = (
+            OrderedDict()
+        )
+        self._info_requests: Dict[str, asyncio.Future[TorrentInfo]] = {}
+
+    async def _request(
+        self, method: str, url: str, limiter: RateLimiter, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an API request once the rate limiter allows it.
+
+        Throttled requests are retried after the delay requested by the API.
+
+        Args:
+            method: HTTP method
+            url: URL relative to the API base URL
+            limiter: Rate limiter to acquire a token from before each attempt
+            **kwargs: Extra arguments passed to the HTTP client
+
+        Returns:
+            Response of the last attempt
+
+        Raises:
+            HTTPError: If the request cannot be sent
+        """
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response = await self.client.request(method, url, **kwargs)
+            if attempt == MAX_THROTTLE_RETRIES or not _is_throttled(response):
+                return response
+            await asyncio.sleep(_retry_after(response, attempt))
+            attempt += 1
 
     async def get_total_torrents(self) -> int:
         """Get total number of torrents in the account.
@@ -109,8 +261,11 @@ class RealDebridClient:
         Raises:
             HTTPError: If API request fails
         """
-        response = await self.client.get(
-            "/torrents", params={"auth_token": self.api_key, "page": 1, "limit": 1}
+        response = await self._request(
+            "GET",
+            "/torrents",
+            self.torrents_limiter,
+            params={"auth_token": self.api_key, "page": 1, "limit": 1},
         )
         response.raise_for_status()
         return int(response.headers.get("X-Total-Count", 0))
@@ -131,12 +286,14 @@ class RealDebridClient:
             HTTPError: If API request fails
         """
         limit = limit or self.settings.fetch_torrents_page_size
-        response = await self.client.get(
+        response = await self._request(
+            "GET",
             "/torrents",
+            self.torrents_limiter,
             params={"auth_token": self.api_key, "page": page, "limit": limit},
         )
         response.raise_for_status()
-        return TorrentList.from_api_response(response.json())
+        return TorrentList.from_api_json(response.content)
 
     async def get_all_torrents(self) -> TorrentList:
         """Get all torrents using pagination.
@@ -150,18 +307,73 @@ class RealDebridClient:
         total_torrents = await self.get_total_torrents()
         total_pages = math.ceil(total_torrents / self.settings.fetch_torrents_page_size)
 
-        all_torrents = []
-        for page in range(1, total_pages + 1):
-            page_torrents = await self.get_torrents_page(page)
-            all_torrents.extend(page_torrents.torrents)
+        # Pages are independent, so fetch them concurrently with a bounded
+        # number of requests in flight
+        semaphore = asyncio.Semaphore(self.settings.fetch_torrents_concurrency)
+
+        async def fetch_page(page: int) -> TorrentList:
+            async with semaphore:
+                return await self.get_torrents_page(page)
+
+        # Cancel the remaining pages if one fails, so discarded requests don't
+        # use up the account's rate limit
+        fetches = [
+            asyncio.ensure_future(fetch_page(page))
+            for page in range(1, total_pages + 1)
+        ]
+        try:
+            pages = await asyncio.gather(*fetches)
+        finally:
+            for fetch in fetches:
+                fetch.cancel()
+
+        return TorrentList(
+            torrents=list(chain.from_iterable(page.torrents for page in pages))
+        )
+
+    async def iter_torrents(self) -> AsyncIterator[Torrent]:
+        """Iterate over all torrents page by page.
+
+        The next page is requested while the current one is being consumed,
+        so only about two pages are held in memory at a time.
 
-        return TorrentList(torrents=all_torrents)
+        Yields:
+            Torrents in API order
 
-    async def get_torrent_info(self, torrent_id: str) -> TorrentInfo:
+        Raises:
+            HTTPError: If API request fails
+        """
+        total_torrents = await self.get_total_torrents()
+        total_pages = math.ceil(total_torrents / self.settings.fetch_torrents_page_size)
+        if not total_pages:
+            return
+
+        next_page = asyncio.ensure_future(self.get_torrents_page(1))
+        try:
+            for page in range(1, total_pages + 1):
+                page_torrents = await next_page
+                if page < total_pages:
+                    next_page = asyncio.ensure_future(self.get_torrents_page(page + 1))
+
+                for torrent in page_torrents.torrents:
+                    yield torrent
+        finally:
+            # Don't leave a prefetch running if the caller stops early, and
+            # explicitly retrieve the error of one that already failed so it
+            # is never reported as unretrieved
+            next_page.cancel()
+            if next_page.done() and not next_page.cancelled():
+                next_page.exception()
+
+    async def get_torrent_info(
+        self, torrent_id: str, max_age: float = INFO_CACHE_TTL
+    ) -> TorrentInfo:
         """Get detailed information about a specific torrent.
 
         Args:
             torrent_id: Torrent ID from Real-Debrid
+            max_age: Seconds a cached copy may be reused without a request,
+                0 to always revalidate with the API
 
         Returns:
             TorrentInfo object with detailed information including files
@@ -170,11 +382,49 @@ class RealDebridClient:
             HTTPError: If API request fails
             TorrentError: If torrent info cannot be retrieved
         """
-        response = await self.client.get(
-            f"/torrents/info/{torrent_id}", params={"auth_token": self.api_key}
+        cached = self._info_cache.get(torrent_id)
+        if cached is not None and time.monotonic() - cached[1] < max_age:
+            return cached[2]
+
+        # Share one in-flight request between concurrent callers
+        pending = self._info_requests.get(torrent_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_torrent_info(torrent_id))
+            self._info_requests[torrent_id] = pending
+            pending.add_done_callback(
+                lambda _: self._info_requests.pop(torrent_id, None)
+            )
+        return await asyncio.shield(pending)
+
+    async def _fetch_torrent_info(self, torrent_id: str) -> TorrentInfo:
+        """Fetch torrent info, revalidating a cached copy with its ETag."""
+        cached = self._info_cache.get(torrent_id)
+        headers = {}
+        if cached is not None and cached[0]:
+            headers["If-None-Match"] = cached[0]
+
+        response = await self._request(
+            "GET",
+            f"/torrents/info/{torrent_id}",
+            self.torrents_limiter,
+            params={"auth_token": self.api_key},
+            headers=headers,
         )
-        response.raise_for_status()
-        return TorrentInfo.parse_obj(response.json())
+        if cached is not None and response.status_code == 304:
+            info = cached[2]
+        else:
+            response.raise_for_status()
+            info = TorrentInfo.model_validate_json(response.content)
+
+        self._info_cache[torrent_id] = (
+            response.headers.get("ETag"),
+            time.monotonic(),
+            info,
+        )
+        self._info_cache.move_to_end(torrent_id)
+        if len(self._info_cache) > INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return info
 
     async def select_files(
         self, torrent_id: str, file_ids: list[int] | str = "all"
@@ -194,21 +444,24 @@ class RealDebridClient:
             if isinstance(file_ids, list)
             else file_ids
         )
-        response = await self.client.post(
+        response = await self._request(
+            "POST",
             f"/torrents/selectFiles/{torrent_id}",
+            self.torrents_limiter,
             params={"auth_token": self.api_key},
             data={"files": files},
         )
         response.raise_for_status()
 
     async def add_magnet(
-        self, hash: str, file_ids: Optional[List[int]] = None
+        self, hash: str, file_ids: Optional[Union[List[int], str]] = None
     ) -> TorrentInfo:
         """Add a hash and optionally select specific files for download.
 
         Args:
             hash: hash to add
-            file_ids: List of specific file IDs to select. If None, no files are auto-selected.
+            file_ids: List of specific file IDs to select, or an already
+                comma-joined string of IDs. If None, no files are auto-selected.
 
         Returns:
             Torrent object representing the added torrent
@@ -217,14 +470,13 @@ class RealDebridClient:
             RealDebridAPIError: If API returns an error response
             TorrentError: If magnet cannot be added
         """
-        # Acquire rate limit token before making API call
-        await self.api_limiter.acquire()
-
         magnet = f"magnet:?xt=urn:btih:{hash}"
         try:
             # Add the magnet
-            response = await self.client.post(
+            response = await self._request(
+                "POST",
                 "/torrents/addMagnet",
+                self.api_limiter,
                 params={"auth_token": self.api_key},
                 data={"magnet": magnet},
             )
@@ -267,6 +519,34 @@ class RealDebridClient:
                 # Handle other HTTP errors (connection, timeout, etc)
                 raise TorrentError(f"HTTP error occurred: {str(e)}")
 
+    async def add_magnets(
+        self,
+        hashes: List[str],
+        file_ids: Optional[Mapping[str, List[int]]] = None,
+        concurrency: int = 10,
+    ) -> List[Union[TorrentInfo, BaseException]]:
+        """Add several hashes concurrently.
+
+        Args:
+            hashes: hashes to add
+            file_ids: File IDs to select per hash. Hashes without an entry get no files auto-selected.
+            concurrency: Maximum number of hashes being added at the same time
+
+        Returns:
+            Added torrent, or the exception raised while adding it, for each hash in order
+        """
+        selected_files = file_ids or {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(hash: str) -> TorrentInfo:
+            async with semaphore:
+                return await self.add_magnet(hash, selected_files.get(hash))
+
+        # Collect failures instead of cancelling the remaining adds
+        return await asyncio.gather(
+            *(add(hash) for hash in hashes), return_exceptions=True
+        )
+
     async def add_magnet_and_wait(
         self,
         magnet: str,
@@ -279,7 +559,7 @@ class RealDebridClient:
         Args:
             magnet: Magnet link to add
             file_ids: List of specific file IDs to select. If None, no files are auto-selected.
-            check_interval: How often to check torrent status in seconds
+            check_interval: Maximum time between torrent status checks in seconds
             timeout: Maximum time to wait in seconds
 
         Returns:
@@ -291,24 +571,52 @@ class RealDebridClient:
             TimeoutError: If torrent takes too long to process
         """
         torrent = await self.add_magnet(magnet, file_ids)
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        interval = min(1.0, check_interval)
 
         while True:
-            if time.time() - start_time > timeout:
-                raise TimeoutError(f"Torrent {torrent.id} took too long to process")
-
-            torrent = await self.get_torrent_info(torrent.id)
-
             if torrent.status == "downloaded":
                 return torrent
             elif torrent.status in ["magnet_error", "error", "virus", "dead"]:
                 raise TorrentError(f"Torrent failed with status: {torrent.status}")
 
-            await asyncio.sleep(check_interval)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Torrent {torrent.id} took too long to process")
+
+            await asyncio.sleep(self._poll_delay(torrent, interval))
+            # Back off towards check_interval for slow torrents
+            interval = min(interval * 1.5, check_interval)
+
+            # Always ask the API, the cache TTL would swallow short intervals
+            torrent = await self.get_torrent_info(torrent.id, max_age=0)
+
+    @staticmethod
+    def _poll_delay(torrent: TorrentInfo, interval: float) -> float:
+        """Get how long to wait before polling a torrent's status again.
+
+        Uses the reported download speed to poll sooner when the torrent is
+        about to finish, and adds jitter so concurrent waiters don't poll
+        in lockstep.
+
+        Args:
+            torrent: Latest known state of the torrent
+            interval: Current backoff interval in seconds
+
+        Returns:
+            Delay in seconds
+        """
+        delay = interval
+        if torrent.speed:
+            remaining_bytes = torrent.bytes_ * (100 - torrent.progress) / 100
+            delay = max(1.0, min(interval, remaining_bytes / torrent.speed))
+        return delay + random.uniform(0, 0.3 * delay)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the client.
+
+        The HTTP client is shared with other instances and is closed by
+        its owner, or with close_shared_client() for the default client.
+        """
 
     async def __aenter__(self):
         """Async context manager enter."""
@@ -1,13 +1,43 @@
 import argparse
+import os
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping, Optional, Tuple, Type
 
 import yaml
 from platformdirs import user_config_dir
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt
 from pydantic.fields import FieldInfo
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
+# Prefer the libyaml-backed loader, which is much faster than the pure
+# Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed config files by resolved path, as (mtime_ns, data)
+_yaml_cache: Dict[Path, Tuple[int, Mapping[str, Any]]] = {}
+
+
+def load_yaml_file(path: Path) -> Mapping[str, Any]:
+    """Load a YAML file, reusing the parsed content until the file changes.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Read-only view of the parsed content
+    """
+    path = path.resolve()
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(path) as f:
+        data = MappingProxyType(yaml.load(f, Loader=YAML_LOADER) or {})
+    _yaml_cache[path] = (mtime_ns, data)
+    return data
+
 
 class LogSettings(BaseModel):
     """Logging-related settings."""
@@ -22,7 +52,15 @@ class APISettings(BaseModel):
     rate_limit_per_minute: int = 250
     torrents_rate_limit_per_minute: int = 75
     timeout_secs: int = 60
+    http_backend: Literal["aiohttp", "httpx"] = "aiohttp"
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    keepalive_expiry_secs: int = 30
+    http2: bool = True
+    retries: int = 2
     fetch_torrents_page_size: int = 2000
+    fetch_torrents_concurrency: PositiveInt = 20
+    transfer_concurrency: PositiveInt = 5
     disable_httpx_logging: bool = True
 
 
@@ -58,6 +96,7 @@ class YAMLConfigSettingsSource(PydanticBaseSettingsSource):
     ) -> None:
         super().__init__(settings_cls)
         self.yaml_path = yaml_path
+        self._yaml_data: Optional[Mapping[str, Any]] = None
 
     def get_config_path(self) -> Path:
         """Get config file path, checking CLI arg and default locations."""
@@ -79,26 +118,25 @@ class YAMLConfigSettingsSource(PydanticBaseSettingsSource):
             )
         return default_path
 
+    def load_yaml(self) -> Mapping[str, Any]:
+        """Load the YAML config, resolving its path only once."""
+        if self._yaml_data is None:
+            self._yaml_data = load_yaml_file(self.yaml_path or self.get_config_path())
+        return self._yaml_data
+
     def get_field_value(
         self, field: FieldInfo, field_name: str
     ) -> Tuple[Any, str, bool]:
         """Get value for a field from YAML config."""
         try:
-            config_path = self.yaml_path or self.get_config_path()
-            with open(config_path) as f:
-                yaml_data = yaml.safe_load(f)
-                field_value = yaml_data.get(field_name)
-                return field_value, field_name, False
+            return self.load_yaml().get(field_name), field_name, False
         except Exception:
             return None, field_name, False
 
     def __call__(self) -> Dict[str, Any]:
         """Load complete config from YAML file."""
         try:
-            config_path = self.yaml_path or self.get_config_path()
-            with open(config_path) as f:
-                yaml_data = yaml.safe_load(f)
-                return yaml_data
+            return dict(self.load_yaml())
         except Exception as e:
             raise ValueError(f"Error loading config file: {e}") from e
 
@@ -145,10 +183,46 @@ class Settings(BaseSettings):
     def api_timeout_secs(self) -> int:
         return self.api.timeout_secs
 
+    @property
+    def api_http_backend(self) -> str:
+        return self.api.http_backend
+
+    @property
+    def api_max_connections(self) -> int:
+        return self.api.max_connections
+
+    @property
+    def api_max_keepalive_connections(self) -> int:
+        return self.api.max_keepalive_connections
+
+    @property
+    def api_keepalive_expiry_secs(self) -> int:
+        return self.api.keepalive_expiry_secs
+
+    @property
+    def api_http2(self) -> bool:
+        return self.api.http2
+
+    @property
+    def api_retries(self) -> int:
+        return self.api.retries
+
     @property
     def fetch_torrents_page_size(self) -> int:
         return self.api.fetch_torrents_page_size
 
+    @property
+    def fetch_torrents_concurrency(self) -> int:
+        return self.api.fetch_torrents_concurrency
+
+    @property
+    def transfer_concurrency(self) -> int:
+        return self.api.transfer_concurrency
+
     @property
     def disable_httpx_logging(self) -> bool:
         return self.api.disable_httpx_logging
+
+    @property
+    def log_level(self) -> str:
+        return self.log.level
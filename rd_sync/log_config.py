@@ -1,6 +1,6 @@
 """Enhanced logging configuration for RD-Sync."""
 
-from datetime import datetime
+import logging
 from typing import Any, Dict
 
 import colorama
@@ -8,11 +8,7 @@ import structlog
 from rich.console import Console
 from rich.traceback import install as install_rich_traceback
 
-# Initialize colorama for Windows support
-colorama.init()
-
-# Install rich traceback handler
-install_rich_traceback(show_locals=False, width=150, suppress=[])
+_configured = False
 
 
 class RDSyncRenderer:
@@ -37,6 +33,7 @@ class RDSyncRenderer:
         "job.skipped": ("yellow", "→"),  # Changed from ⏭️ to →
         "job.closed": ("green", "✓"),  # Changed from ✅ to ✓
         "job.failed": ("red", "×"),  # Changed from ❌ to ×
+        "job.cancelled": ("yellow", "■"),
         # Sync events
         "sync.started": ("blue", "⟳"),  # Changed from 🔄 to ⟳
         "sync.complete": ("green", "✓"),  # Changed from ✅ to ✓
@@ -49,6 +46,7 @@ class RDSyncRenderer:
         # Transfer events
         "transfer.started": ("blue", "↓"),  # Changed from ⬇️ to ↓
         "transfer.complete": ("green", "✓"),  # Changed from ✅ to ✓
+        "transfer.progress": ("blue", "»"),
         # App events
         "app.starting": ("blue", "►"),  # Changed from 🚀 to ►
         "shutdown.initiated": ("yellow", "■"),  # Changed from ⏳ to ■
@@ -59,34 +57,40 @@ class RDSyncRenderer:
         """Initialize the renderer."""
         self.console = Console(force_terminal=True, color_system="truecolor")
 
+        # Resolve ANSI prefixes once instead of on every log line
+        self._level_ansi = {
+            level: f"\033[1;{self._get_ansi_color(color)}m"
+            for level, color in self.LEVEL_COLORS.items()
+        }
+        self._default_level_ansi = f"\033[1;{self._get_ansi_color('white')}m"
+        self._event_ansi = {
+            event: (f"\033[{self._get_ansi_color(style)}m", icon)
+            for event, (style, icon) in self.EVENT_STYLES.items()
+        }
+        self._default_event_ansi = (f"\033[{self._get_ansi_color('white')}m", "·")
+
     def __call__(self, _: Any, __: str, event_dict: Dict[str, Any]) -> str:
         """Format the log message with colors and structure."""
-        # Extract basic fields
-        timestamp = event_dict.pop("timestamp", datetime.now().isoformat())
+        # Extract basic fields, the timestamp is added by TimeStamper
+        timestamp = event_dict.pop("timestamp", "")
         level = event_dict.pop("level", "info").lower()
         event_name = event_dict.pop("event", "")
         job = event_dict.pop("job", "main")
 
-        # Construct the message
-        parts = []
-
-        # Timestamp with reduced visibility
-        parts.append(f"\033[2m{timestamp}\033[0m")
-
-        # Log level with color (increase padding from 8 to 10)
-        level_color = self.LEVEL_COLORS.get(level, "white")
-        parts.append(f"\033[1;{self._get_ansi_color(level_color)}m{level:10}\033[0m")
-
-        # Job name in cyan (increase padding from 15 to 20)
-        parts.append(f"\033[36m{job:20}\033[0m")
+        level_ansi = self._level_ansi.get(level, self._default_level_ansi)
+        event_ansi, icon = self._event_ansi.get(event_name, self._default_event_ansi)
 
-        # Event with emoji and color
-        style, icon = self.EVENT_STYLES.get(event_name, ("white", "·"))
-        color_code = self._get_ansi_color(style)
+        # Dimmed timestamp, colored level, job name in cyan, then the event
+        # with its icon (monospace ASCII characters for consistent width)
+        message = (
+            f"\033[2m{timestamp}\033[0m "
+            f"{level_ansi}{level:10}\033[0m "
+            f"\033[36m{job:20}\033[0m "
+            f"{event_ansi} {icon} {event_name:<25}\033[0m"
+        )
 
-        # Using monospace ASCII characters for consistent width
-        event_display = f" {icon} {event_name:<25}"  # Added space before icon
-        parts.append(f"\033[{color_code}m{event_display}\033[0m")
+        if not event_dict:
+            return message
 
         # Format remaining fields with improved readability
         extras = []
@@ -111,9 +115,9 @@ class RDSyncRenderer:
             extras.append(f"\033[33m{key}\033[0m={formatted_value}")
 
         if extras:
-            parts.append(" ".join(extras))
+            message = f"{message} {' '.join(extras)}"
 
-        return " ".join(parts)
+        return message
 
     def _get_ansi_color(self, color: str) -> str:
         """Convert color name to ANSI color code."""
@@ -144,8 +148,28 @@ class RDSyncRenderer:
         return color_map.get(color, "37")
 
 
-def setup_logging() -> None:
-    """Configure structured logging with ConsoleRenderer."""
+def setup_logging(level: str = "INFO") -> None:
+    """Configure structured logging with ConsoleRenderer.
+
+    Loggers are specialized for the level once, so calls below it return
+    immediately without running the processor chain.
+
+    Safe to call more than once, only the first call has an effect.
+
+    Args:
+        level: Minimum level name to log, e.g. "INFO"
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # Initialize colorama for Windows support
+    colorama.init()
+
+    # Install rich traceback handler
+    install_rich_traceback(show_locals=False, width=150, suppress=[])
+
     processors = [
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=False),
@@ -156,7 +180,9 @@ def setup_logging() -> None:
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(level.upper())
+        ),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -1,12 +1,13 @@
 import asyncio
 import signal
+from rd_sync.client import close_shared_client
 from rd_sync.config import Settings
 from rd_sync.log_config import get_logger, setup_logging
 from rd_sync.scheduler import SyncScheduler
 
 # Initialize logging
 settings = Settings()
-setup_logging()
+setup_logging(settings.log_level)
 logger = get_logger()
 
 
@@ -21,24 +22,26 @@ async def main():
         # Setup signal handlers
         loop = asyncio.get_running_loop()
         scheduler = SyncScheduler(settings)
+        stop = asyncio.Event()
 
         def handle_shutdown(sig):
             logger.warning(
                 "shutdown.initiated", msg="Gracefully shutting down RD-Sync service"
             )
-            asyncio.create_task(scheduler.stop())
+            stop.set()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, lambda s=sig: handle_shutdown(s))
 
         async with scheduler:
-            # Wait for shutdown signal
-            await scheduler.wait_for_shutdown()
+            # Wait for shutdown signal, the scheduler is stopped on exit
+            await stop.wait()
 
     except Exception as e:
         logger.error("main.error", error=str(e))
         raise
     finally:
+        await close_shared_client()
         logger.info("shutdown.complete")
 
 
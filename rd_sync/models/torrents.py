@@ -1,10 +1,17 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class TorrentFile(BaseModel):
+class RDBaseModel(BaseModel):
+    """Base model for Real-Debrid API objects."""
+
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
+
+
+class TorrentFile(RDBaseModel):
     """Model representing a file in a torrent."""
 
     id: int
@@ -13,7 +20,7 @@ class TorrentFile(BaseModel):
     selected: int = Field(..., description="0 or 1")
 
 
-class TorrentInfo(BaseModel):
+class TorrentInfo(RDBaseModel):
     """Model representing detailed torrent information from Real-Debrid."""
 
     id: str
@@ -50,7 +57,7 @@ class TorrentInfo(BaseModel):
     )
 
 
-class Torrent(BaseModel):
+class Torrent(RDBaseModel):
     """Model representing a torrent in Real-Debrid."""
 
     id: str
@@ -75,6 +82,9 @@ class Torrent(BaseModel):
     ]
     added: datetime
     links: Optional[List[str]] = Field(None, description="Host URLs")
+    files: Optional[List[TorrentFile]] = Field(
+        None, description="Only present if the listing includes file details"
+    )
     ended: Optional[datetime] = Field(None, description="Only present when finished")
     speed: Optional[int] = Field(
         None, description="Only present in downloading, compressing, uploading status"
@@ -89,18 +99,29 @@ class Torrent(BaseModel):
         Returns:
             bool: True if torrent is ready for sync, False otherwise
         """
-        return self.progress != 100 or self.links is None or len(self.links) == 0
+        return self.progress == 100 and bool(self.links)
+
 
+_TORRENT_LIST_ADAPTER = TypeAdapter(List[Torrent])
 
-class TorrentList(BaseModel):
-    """Model representing a list of torrents."""
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@dataclass(slots=True)
+class TorrentList:
+    """List of torrents validated from an API response."""
 
     torrents: List[Torrent]
 
     @classmethod
     def from_api_response(cls, data: List[dict]) -> "TorrentList":
         """Create TorrentList from API response data."""
-        return cls(torrents=[Torrent.parse_obj(item) for item in data])
+        return cls(torrents=_TORRENT_LIST_ADAPTER.validate_python(data))
+
+    @classmethod
+    def from_api_json(cls, data: bytes) -> "TorrentList":
+        """Create TorrentList from a raw JSON API response body."""
+        return cls(torrents=_TORRENT_LIST_ADAPTER.validate_json(data))
 
     def __len__(self):
         return len(self.torrents)
@@ -108,9 +129,7 @@ class TorrentList(BaseModel):
     @staticmethod
     def format_size(bytes_: int) -> str:
         """Format bytes into human readable format."""
-        size = float(bytes_)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                return f"{size:.2f} {unit}"
-            size /= 1024
-        return f"{size:.2f} PB"
+        # Each unit is 2**10 times the previous one, so the unit index
+        # follows from the bit length without dividing in a loop
+        unit_idx = min(len(SIZE_UNITS) - 1, max(0, (bytes_.bit_length() - 1) // 10))
+        return f"{bytes_ / (1 << (unit_idx * 10)):.2f} {SIZE_UNITS[unit_idx]}"
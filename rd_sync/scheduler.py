@@ -1,17 +1,29 @@
 import asyncio
+import functools
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Set
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.base import undefined
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from rd_sync.client import RealDebridClient
 from rd_sync.config import Settings, SyncConfig
 from rd_sync.log_config import get_logger
 from rd_sync.sync import RealDebridSync
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_crontab(expression: str) -> CronTrigger:
+    """Parse a crontab expression, reusing the trigger for repeated expressions.
+
+    CronTrigger is not modified when computing fire times, so one
+    instance can safely be shared by several jobs.
+    """
+    return CronTrigger.from_crontab(expression)
+
+
 class SyncScheduler:
     """Manages scheduled sync jobs using APScheduler."""
 
@@ -23,6 +35,11 @@ class SyncScheduler:
         self.log = get_logger("scheduler")
         self._shutdown_event = asyncio.Event()
         self._cleanup_timeout = 5.0  # seconds
+        # Clients by API token, so jobs sharing an account also share its
+        # rate limiters and torrent info cache
+        self._client_cache: Dict[str, RealDebridClient] = {}
+        # Sync runs in progress, cancelled on stop before clients are closed
+        self._running: Set[asyncio.Task] = set()
 
     async def add_sync_job(self, name: str, config: SyncConfig) -> None:
         """Add a new sync job to the scheduler."""
@@ -40,9 +57,9 @@ class SyncScheduler:
             return
 
         sync = RealDebridSync(
-            source_account.token,
+            self._get_client(source_account.token),
             name,
-            dest_account.token,
+            self._get_client(dest_account.token),
             self.settings,
             config.dry_run,
         )
@@ -53,10 +70,11 @@ class SyncScheduler:
             trigger = IntervalTrigger(seconds=int(config.schedule.value))
             next_run_time = datetime.now()
         else:  # cron
-            trigger = CronTrigger.from_crontab(config.schedule.value)
+            trigger = _parse_crontab(str(config.schedule.value))
 
         job = self.scheduler.add_job(
-            sync.sync,
+            self._run_job,
+            args=(sync,),
             trigger=trigger,
             id=name,
             name=name,
@@ -76,6 +94,29 @@ class SyncScheduler:
             destination=config.destination,
         )
 
+    def _get_client(self, token: str) -> RealDebridClient:
+        """Get the client for an account token, creating it on first use."""
+        client = self._client_cache.get(token)
+        if client is None:
+            # Every client uses the process-wide shared HTTP client, which
+            # is closed by the application with close_shared_client()
+            client = RealDebridClient(token, self.settings)
+            self._client_cache[token] = client
+        return client
+
+    async def _run_job(self, sync: RealDebridSync) -> None:
+        """Run a sync job, tracking its task so stop() can cancel it."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        try:
+            await sync.sync()
+        except asyncio.CancelledError:
+            # Only stop() cancels runs, end quietly instead of having
+            # APScheduler report the cancellation as a job failure
+            sync.log.warning("job.cancelled")
+
     async def start(self) -> None:
         """Start the scheduler and add configured sync jobs."""
         self.log.info("scheduler.starting")
@@ -104,6 +145,14 @@ class SyncScheduler:
             # Shutdown the scheduler
             self.scheduler.shutdown(wait=False)
 
+            # Cancel running syncs and let them unwind before their clients
+            # are closed underneath them
+            running = set(self._running)
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running, timeout=self._cleanup_timeout)
+
             # Close all active jobs with timeout
             close_tasks = []
             for name, sync in self._active_jobs.items():
@@ -112,10 +161,23 @@ class SyncScheduler:
 
             if close_tasks:
                 # Wait for all jobs to close with timeout
-                await asyncio.wait(close_tasks, timeout=self._cleanup_timeout)
+                _, pending = await asyncio.wait(
+                    close_tasks, timeout=self._cleanup_timeout
+                )
+                # Cancel jobs still closing and wait for them to unwind, so
+                # no task outlives the scheduler
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.log.warning("scheduler.close_timeout", pending=len(pending))
+                    await asyncio.gather(*pending, return_exceptions=True)
 
             self._active_jobs.clear()
 
+            # Clients hold no connections of their own, the shared HTTP
+            # client is closed by the application with close_shared_client()
+            self._client_cache.clear()
+
         except Exception as e:
             self.log.error("scheduler.stop_error", error=str(e))
         finally:
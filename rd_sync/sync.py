@@ -1,29 +1,55 @@
 """Sync module for Real-Debrid synchronization."""
 
-from typing import Optional
+import asyncio
+import time
+from typing import List, Optional, Sequence, Tuple, Union
 
 from rd_sync.client import RealDebridClient, RealDebridError
 from rd_sync.config import Settings
 from rd_sync.log_config import get_logger
+from rd_sync.models.torrents import Torrent, TorrentFile
 
 
 class RealDebridSync:
     """Real-Debrid synchronization manager."""
 
+    __slots__ = (
+        "settings",
+        "source",
+        "destination",
+        "job_name",
+        "log",
+        "dry_run",
+        "concurrency",
+        "_progress_interval",
+        "_last_log_ts",
+    )
+
     def __init__(
         self,
-        source_api_key: str,
+        source: Union[str, RealDebridClient],
         job_name: str,
-        destination_api_key: str,
+        destination: Union[str, RealDebridClient],
         settings: Optional[Settings] = None,
         dry_run: bool = False,
     ):
         self.settings = settings or Settings()
-        self.source = RealDebridClient(source_api_key, self.settings)
-        self.destination = RealDebridClient(destination_api_key, self.settings)
+        # Source and destination are API keys or ready-made clients
+        self.source = self._get_client(source)
+        self.destination = self._get_client(destination)
         self.job_name = job_name
         self.log = get_logger(job_name)
         self.dry_run = dry_run
+        self.concurrency = self.settings.transfer_concurrency
+        # Report transfer progress every N torrents or at least once a second
+        self._progress_interval = 25
+        self._last_log_ts = 0.0
+
+    def _get_client(self, account: Union[str, RealDebridClient]) -> RealDebridClient:
+        """Get a client for an account, creating it from an API key if needed."""
+        if isinstance(account, RealDebridClient):
+            return account
+        return RealDebridClient(account, self.settings)
 
     async def sync(self):
         """Synchronize torrents from source to destination."""
@@ -35,78 +61,161 @@ class RealDebridSync:
             self.log.info(
                 "torrents.fetching", msg="Fetching torrents from source and destination"
             )
-            source_torrents = await self.source.get_all_torrents()
-            destination_torrents = await self.destination.get_all_torrents()
-
-            # Create hash sets for comparison
-            source_hashes = {t.hash: t for t in source_torrents.torrents}
-            dest_hashes = {t.hash: t for t in destination_torrents.torrents}
-            torrents_to_sync = set(source_hashes.keys()) - set(dest_hashes.keys())
+            # Both accounts are independent, so fetch them concurrently and
+            # cancel the other listing if one fails
+            fetches = (
+                asyncio.ensure_future(self.source.get_all_torrents()),
+                asyncio.ensure_future(self.destination.get_all_torrents()),
+            )
+            try:
+                source_torrents, destination_torrents = await asyncio.gather(*fetches)
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+
+            # Keep only source torrents missing from the destination
+            dest_hashes = {t.hash for t in destination_torrents.torrents}
+            source_hashes = {
+                t.hash: t for t in source_torrents.torrents if t.hash not in dest_hashes
+            }
+            torrents_to_sync = source_hashes.keys()
+            total = len(torrents_to_sync)
 
             # Analysis summary
             self.log.info(
                 "sync.analysis",
                 source_count=len(source_torrents),
                 dest_count=len(destination_torrents),
-                sync_count=len(torrents_to_sync),
+                sync_count=total,
             )
 
             if not torrents_to_sync:
                 self.log.info("sync.complete", message="All torrents are in sync")
                 return
 
-            success_count = error_count = 0
-
-            self.log.info("transfer.started", count=len(torrents_to_sync))
-
-            for hash in torrents_to_sync:
-                torrent = source_hashes[hash]
-                try:
-                    source_info = await self.source.get_torrent_info(torrent.id)
-                    selected_files = [
-                        f.id for f in source_info.files if f.selected == 1
-                    ]
-
-                    total_files = len(source_info.files)
-                    selected_count = len(selected_files)
-                    progress = (
-                        (success_count + error_count + 1) / len(torrents_to_sync) * 100
-                    )
-                    if not self.dry_run:
-                        await self.destination.add_magnet(hash, selected_files)
-                    success_count += 1
-                    self.log.info(
-                        "torrent.added",
-                        name=torrent.filename,
-                        progress=f"{progress:.0f}%",
-                        current=success_count + error_count,
-                        total=len(torrents_to_sync),
-                        files=f"{selected_count}/{total_files}",
-                        hash=hash,
-                    )
+            self.log.info("transfer.started", count=total)
 
-                except Exception as e:
-                    error_count += 1
-                    self.log.error(
-                        "torrent.failed", name=torrent.filename, error=str(e), hash=hash
-                    )
+            # Sorted by hash so reruns work through torrents in the same order
+            success_count, error_count = await self._transfer(
+                tuple(source_hashes[hash] for hash in sorted(torrents_to_sync))
+            )
 
             self.log.info(
                 "sync.complete",
                 success_count=success_count,
                 error_count=error_count,
-                total=len(torrents_to_sync),
-                success_rate=f"{(success_count/len(torrents_to_sync))*100:.1f}%",
+                total=total,
+                success_rate=f"{(success_count/total)*100:.1f}%",
             )
 
         except Exception as e:
             self.log.error("sync.failed", error=str(e))
             raise RealDebridError("Synchronization failed") from e
 
+    async def _transfer(self, torrents: Sequence[Torrent]) -> Tuple[int, int]:
+        """Add source torrents to the destination with the same files selected.
+
+        File lists are fetched from the source by one pool of workers, unless
+        the listing already included them, and handed through a bounded queue
+        to a second pool adding torrents to the destination, so neither stage
+        waits for the other.
+
+        Args:
+            torrents: Source torrents missing from the destination
+
+        Returns:
+            Number of torrents added and number of failures
+        """
+        total = len(torrents)
+        pending = iter(torrents)
+        files_queue: asyncio.Queue[
+            Optional[Tuple[Torrent, Union[List[TorrentFile], Exception]]]
+        ] = asyncio.Queue(maxsize=2 * self.concurrency)
+        success_count = error_count = 0
+        # Bound once for the worker loops below
+        log = self.log
+        get_torrent_info = self.source.get_torrent_info
+        add_magnet = self.destination.add_magnet
+        dry_run = self.dry_run
+
+        async def fetch_info() -> None:
+            # Workers share one iterator, so each torrent is fetched once
+            for torrent in pending:
+                # Skip the info request when the listing already has the files
+                files: Union[List[TorrentFile], Exception]
+                if torrent.files is not None:
+                    files = torrent.files
+                else:
+                    try:
+                        files = (await get_torrent_info(torrent.id)).files
+                    except Exception as e:
+                        files = e
+                await files_queue.put((torrent, files))
+
+        async def fetch_all_info() -> None:
+            await asyncio.gather(*(fetch_info() for _ in range(self.concurrency)))
+            # One sentinel per consumer to signal that no more info is coming
+            for _ in range(self.concurrency):
+                await files_queue.put(None)
+
+        def report_progress() -> None:
+            completed = success_count + error_count
+            now = time.monotonic()
+            if (
+                completed % self._progress_interval == 0
+                or completed == total
+                or now - self._last_log_ts > 1.0
+            ):
+                self._last_log_ts = now
+                log.info(
+                    "transfer.progress",
+                    progress=round(completed / total * 100, 1),
+                    current=completed,
+                    total=total,
+                    success_count=success_count,
+                    error_count=error_count,
+                )
+
+        async def add_torrents() -> None:
+            nonlocal success_count, error_count
+            while (item := await files_queue.get()) is not None:
+                torrent, files = item
+                try:
+                    if isinstance(files, Exception):
+                        raise files
+                    selected_ids = [str(f.id) for f in files if f.selected == 1]
+                    if not dry_run:
+                        # Passed through as the comma-joined form the API expects
+                        await add_magnet(torrent.hash, ",".join(selected_ids))
+                except Exception as e:
+                    error_count += 1
+                    log.error(
+                        "torrent.failed",
+                        name=torrent.filename,
+                        error=str(e),
+                        hash=torrent.hash,
+                    )
+                else:
+                    success_count += 1
+                    log.debug(
+                        "torrent.added",
+                        name=torrent.filename,
+                        files=(len(selected_ids), len(files)),
+                        hash=torrent.hash,
+                    )
+                report_progress()
+
+        await asyncio.gather(
+            fetch_all_info(), *(add_torrents() for _ in range(self.concurrency))
+        )
+        return success_count, error_count
+
     async def close(self):
-        """Close both source and destination clients."""
-        await self.source.close()
-        await self.destination.close()
+        """Close the sync.
+
+        Clients hold no connections of their own, they all use the shared
+        HTTP client, which is closed with close_shared_client().
+        """
 
     async def __aenter__(self):
         """Async context manager enter."""
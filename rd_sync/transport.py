@@ -0,0 +1,83 @@
+"""aiohttp-backed transport for the httpx client."""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+import httpx
+
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """httpx transport that sends requests through a long-lived aiohttp session.
+
+    The client keeps using the httpx request/response API, while connection
+    pooling and request dispatch are handled by aiohttp.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        dns_cache_ttl: int = 300,
+    ):
+        """Initialize the transport.
+
+        Args:
+            max_connections: Maximum number of simultaneous connections
+            keepalive_expiry: Seconds an idle connection is kept alive
+            dns_cache_ttl: Seconds resolved host addresses are cached
+        """
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it inside the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_expiry,
+            )
+            # httpx decodes the body itself based on Content-Encoding
+            self._session = aiohttp.ClientSession(
+                connector=connector, auto_decompress=False
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request and return the fully read response."""
+        timeout = request.extensions.get("timeout", {})
+        try:
+            async with self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=dict(request.headers),
+                data=await request.aread(),
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(
+                    connect=timeout.get("pool"),
+                    sock_connect=timeout.get("connect"),
+                    sock_read=timeout.get("read"),
+                ),
+            ) as response:
+                content = await response.read()
+        except asyncio.TimeoutError as e:
+            raise httpx.TimeoutException(str(e), request=request) from e
+        except aiohttp.ClientConnectorError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.NetworkError(str(e), request=request) from e
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.raw_headers,
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and its connections."""
+        if self._session is not None:
+            await self._session.close()
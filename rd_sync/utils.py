@@ -3,7 +3,13 @@ import time
 
 
 class RateLimiter:
-    """Rate limiter for API calls."""
+    """Rate limiter for API calls.
+
+    Implements the generic cell rate algorithm: each caller reserves its
+    slot by advancing a virtual finish time, then sleeps once until the
+    slot is due. Up to `calls` calls may burst through at once, after that
+    calls are spaced `period / calls` apart in the order they arrived.
+    """
 
     def __init__(self, calls: int, period: float = 60.0):
         """Initialize rate limiter.
@@ -14,9 +20,10 @@ class RateLimiter:
         """
         self.calls = calls
         self.period = period
-        self.tokens = calls
-        self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        # Seconds between calls once the burst is used up
+        self._interval = period / calls
+        # Time at which all reserved tokens will have been replenished
+        self._next = time.monotonic()
 
     async def acquire(self, tokens: int = 1):
         """Acquire tokens from the rate limiter.
@@ -24,18 +31,20 @@ class RateLimiter:
         Args:
             tokens: Number of tokens to acquire
         """
-        async with self._lock:
-            while self.tokens < tokens:
-                now = time.monotonic()
-                time_passed = now - self.last_update
-                new_tokens = time_passed * (self.calls / self.period)
-
-                if new_tokens > 1:
-                    self.tokens = min(self.calls, self.tokens + new_tokens)
-                    self.last_update = now
-
-                if self.tokens < tokens:
-                    sleep_time = (tokens - self.tokens) * (self.period / self.calls)
-                    await asyncio.sleep(sleep_time)
-
-            self.tokens -= tokens
+        # Nothing is awaited while reserving, so concurrent callers can't
+        # interleave here and no lock is needed
+        now = time.monotonic()
+        deadline = max(now, self._next) + tokens * self._interval
+        self._next = deadline
+
+        # The bucket holds a full period of calls, so the reservation may
+        # proceed as soon as it falls within one period from now
+        delay = deadline - self.period - now
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # Give back the slot if no later caller has queued behind it
+                if self._next == deadline:
+                    self._next -= tokens * self._interval
+                raise